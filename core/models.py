@@ -137,6 +137,7 @@ def listar_transacoes_filtradas(
     data_inicio: Optional[str] = None,
     data_fim: Optional[str] = None,
     limite: int = 200,
+    offset: int = 0,
 ) -> list[dict]:
     """
     Lista transações com filtros opcionais de busca e datas.
@@ -156,6 +157,7 @@ def listar_transacoes_filtradas(
         data_inicio: Data mínima de lançamento (inclusive).
         data_fim: Data máxima de lançamento (inclusive).
         limite: Número máximo de resultados.
+        offset: Quantidade de resultados a pular (paginação).
 
     Returns:
         Lista de dicionários com os campos da transação e colunas
@@ -189,6 +191,9 @@ def listar_transacoes_filtradas(
         )
         sql.append("LIMIT ?")
         params.append(limite)
+        if offset:
+            sql.append("OFFSET ?")
+            params.append(offset)
         query = "\n".join(sql)
         cur = conn.execute(query, tuple(params))
         return [dict(row) for row in cur.fetchall()]
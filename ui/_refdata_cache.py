@@ -0,0 +1,53 @@
+"""
+Cache de dados de referência (categorias, centros de custo e contas).
+
+Os diálogos de transação abrem várias vezes por sessão e cada abertura
+refazia as mesmas consultas para preencher combos. Este módulo memoiza
+as listas por ``codigoempresa`` como tuplas imutáveis de ``(id, nome)``;
+as telas de cadastro chamam :func:`invalidate` ao criar/editar/excluir
+registros para que a próxima leitura volte ao banco.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+try:
+    from core import models  # type: ignore
+except ImportError:
+    import models  # type: ignore
+
+
+@lru_cache(maxsize=32)
+def categorias(codigoempresa: str) -> tuple:
+    return tuple(
+        (c["id"], c["nome"]) for c in models.listar_categorias(codigoempresa)
+    )
+
+
+@lru_cache(maxsize=32)
+def centros_custo(codigoempresa: str) -> tuple:
+    return tuple(
+        (c["id"], c["nome"]) for c in models.listar_centros_custo(codigoempresa)
+    )
+
+
+@lru_cache(maxsize=32)
+def contas(codigoempresa: str) -> tuple:
+    return tuple(
+        (c["id"], c.get("nome_conta") or str(c["id"]))
+        for c in models.listar_contas(codigoempresa)
+    )
+
+
+def invalidate(codigoempresa: str | None = None) -> None:
+    """Descarta as listas cacheadas após mudanças nos cadastros.
+
+    ``lru_cache`` não permite remover uma chave específica, então o
+    parâmetro existe só por simetria com os chamadores — qualquer
+    invalidação limpa os três caches por inteiro, o que é barato dado o
+    tamanho das listas.
+    """
+    categorias.cache_clear()
+    centros_custo.cache_clear()
+    contas.cache_clear()
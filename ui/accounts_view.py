@@ -35,6 +35,8 @@ from core.models import (
     excluir_conta,
 )
 
+from . import _refdata_cache
+
 
 class ContaDialog(QtWidgets.QDialog):
     """Dialog for creating or editing a bank account."""
@@ -272,6 +274,8 @@ class AccountsView(QtWidgets.QWidget):
 
     def _carregar_contas(self) -> None:
         contas = listar_contas(self.codigoempresa)
+        # Só o id (int) vai para o QVariant; o dict fica neste índice local
+        self._conta_by_id = {c["id"]: c for c in contas}
         self.table.setRowCount(len(contas))
         for row_idx, conta in enumerate(contas):
             items = [
@@ -286,7 +290,7 @@ class AccountsView(QtWidgets.QWidget):
             for col, val in enumerate(items):
                 item = QtWidgets.QTableWidgetItem(val)
                 if col == 0:
-                    item.setData(QtCore.Qt.UserRole, conta)
+                    item.setData(QtCore.Qt.UserRole, int(conta["id"]))
                 self.table.setItem(row_idx, col, item)
 
     def _get_selected_conta(self) -> Optional[dict]:
@@ -295,11 +299,12 @@ class AccountsView(QtWidgets.QWidget):
             return None
         row_idx = rows[0].row()
         item = self.table.item(row_idx, 0)
-        return item.data(QtCore.Qt.UserRole)
+        return self._conta_by_id.get(item.data(QtCore.Qt.UserRole))
 
     def _add_conta(self) -> None:
         dlg = ContaDialog(self.codigoempresa, self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            _refdata_cache.invalidate(self.codigoempresa)
             self._carregar_contas()
 
     def _edit_conta(self) -> None:
@@ -311,6 +316,7 @@ class AccountsView(QtWidgets.QWidget):
             return
         dlg = ContaDialog(self.codigoempresa, self, conta=conta)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            _refdata_cache.invalidate(self.codigoempresa)
             self._carregar_contas()
 
     def _delete_conta(self) -> None:
@@ -334,4 +340,5 @@ class AccountsView(QtWidgets.QWidget):
                 self, "Erro", f"Falha ao excluir conta:\n{exc}"
             )
             return
+        _refdata_cache.invalidate(self.codigoempresa)
         self._carregar_contas()
\ No newline at end of file
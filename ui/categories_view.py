@@ -14,6 +14,8 @@ from core.models import (
     excluir_categoria,
 )
 
+from . import _refdata_cache
+
 
 class CategoriaDialog(QtWidgets.QDialog):
     """
@@ -182,6 +184,8 @@ class CategoriesView(QtWidgets.QWidget):
 
     def _carregar_categorias(self):
         categorias = listar_categorias(self.codigoempresa)
+        # Só o id (int) vai para o QVariant; o dict fica neste índice local
+        self._cat_by_id = {c["id"]: c for c in categorias}
         self.table.setRowCount(len(categorias))
         for row_idx, cat in enumerate(categorias):
             items = [
@@ -194,7 +198,7 @@ class CategoriesView(QtWidgets.QWidget):
             for col, val in enumerate(items):
                 item = QtWidgets.QTableWidgetItem(val)
                 if col == 0:
-                    item.setData(QtCore.Qt.UserRole, cat)
+                    item.setData(QtCore.Qt.UserRole, int(cat["id"]))
                 self.table.setItem(row_idx, col, item)
 
     def _get_selected_categoria(self) -> Optional[dict]:
@@ -203,12 +207,12 @@ class CategoriesView(QtWidgets.QWidget):
             return None
         row_idx = rows[0].row()
         item = self.table.item(row_idx, 0)
-        cat = item.data(QtCore.Qt.UserRole)
-        return cat
+        return self._cat_by_id.get(item.data(QtCore.Qt.UserRole))
 
     def _add_categoria(self):
         dlg = CategoriaDialog(self.codigoempresa, self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            _refdata_cache.invalidate(self.codigoempresa)
             self._carregar_categorias()
 
     def _edit_categoria(self):
@@ -220,6 +224,7 @@ class CategoriesView(QtWidgets.QWidget):
             return
         dlg = CategoriaDialog(self.codigoempresa, self, categoria=cat)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            _refdata_cache.invalidate(self.codigoempresa)
             self._carregar_categorias()
 
     def _delete_categoria(self):
@@ -243,4 +248,5 @@ class CategoriesView(QtWidgets.QWidget):
                 self, "Erro", f"Falha ao excluir categoria:\n{exc}"
             )
             return
+        _refdata_cache.invalidate(self.codigoempresa)
         self._carregar_categorias()
\ No newline at end of file
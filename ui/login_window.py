@@ -4,8 +4,8 @@ import unicodedata
 from typing import Optional, List, Dict
 
 import requests
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import Qt, QRegExp
+from PyQt5.QtGui import QKeySequence, QRegExpValidator, QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -28,6 +28,13 @@ def hash_senha(senha: str) -> str:
     return hashlib.sha256(senha.encode("utf-8")).hexdigest()
 
 
+# Mapa para o slug: A-Z e 0-9 passam direto, todo o resto vira "_"
+_SLUG_TABLE = {i: "_" for i in range(256)}
+_SLUG_TABLE.update(
+    {c: chr(c) for c in (*range(ord("A"), ord("Z") + 1), *range(ord("0"), ord("9") + 1))}
+)
+
+
 def gerar_codigoempresa_slug(texto: str, fallback: str) -> str:
     """
     Gera um código interno sem espaços, sem acentos e só com [A-Z0-9_].
@@ -39,12 +46,14 @@ def gerar_codigoempresa_slug(texto: str, fallback: str) -> str:
 
     base = base.upper()
 
-    # remover acentos
-    base = unicodedata.normalize("NFKD", base)
-    base = "".join(c for c in base if not unicodedata.combining(c))
+    # remover acentos em uma única passada no codec C; entradas já ASCII
+    # nem precisam do NFKD
+    if not base.isascii():
+        base = unicodedata.normalize("NFKD", base)
+        base = base.encode("ascii", "ignore").decode("ascii")
 
-    # qualquer coisa que não seja A-Z ou 0-9 vira "_"
-    base = re.sub(r"[^A-Z0-9]+", "_", base)
+    # qualquer coisa que não seja A-Z ou 0-9 vira "_" (uma passada em C)
+    base = base.translate(_SLUG_TABLE)
     base = re.sub(r"_+", "_", base).strip("_")
 
     if len(base) > 20:
@@ -78,7 +87,11 @@ class EmpresaEscolhaDialog(QDialog):
         label.setWordWrap(True)
         layout.addWidget(label)
 
+        # Montar o modelo inteiro antes de ligar no combo: um único reset de
+        # modelo em vez de um sinal de mudança por addItem
         self.combo = QComboBox()
+        model = QStandardItemModel(self.combo)
+        items = []
         for emp in self.empresas:
             cod = emp.get("codigoempresa") or ""
             razao = emp.get("razao_social") or ""
@@ -91,7 +104,11 @@ class EmpresaEscolhaDialog(QDialog):
                 texto = f"{razao} — [{cod}]"
             else:
                 texto = cod
-            self.combo.addItem(texto, cod)
+            item = QStandardItem(texto)
+            item.setData(cod, Qt.UserRole)
+            items.append(item)
+        model.invisibleRootItem().appendRows(items)
+        self.combo.setModel(model)
         layout.addWidget(self.combo)
 
         btn_row = QHBoxLayout()
@@ -109,11 +126,10 @@ class EmpresaEscolhaDialog(QDialog):
         layout.addLayout(btn_row)
 
     def _on_ok(self):
-        idx = self.combo.currentIndex()
-        if idx < 0:
+        if self.combo.currentIndex() < 0:
             QMessageBox.warning(self, "Atenção", "Selecione uma empresa.")
             return
-        self._codigoempresa = self.combo.itemData(idx)
+        self._codigoempresa = self.combo.currentData(Qt.UserRole)
         self.accept()
 
     def get_codigoempresa(self) -> Optional[str]:
@@ -160,6 +176,11 @@ class NovaEmpresaDialog(QDialog):
 
         self.edit_codigoempresa = QLineEdit()
         self.edit_codigoempresa.setPlaceholderText("Identificador interno (ex.: ALFA_TRANSPORTES)")
+        # O validador rejeita entrada inválida já na digitação, em vez de
+        # validar de novo (com popup modal) a cada clique em Salvar
+        self.edit_codigoempresa.setValidator(
+            QRegExpValidator(QRegExp(r"[A-Z0-9_]{1,20}"), self)
+        )
         form.addRow("Código da empresa:", self.edit_codigoempresa)
 
         cnpj_row = QHBoxLayout()
@@ -180,6 +201,11 @@ class NovaEmpresaDialog(QDialog):
         self.edit_fantasia.setPlaceholderText("Nome fantasia")
         form.addRow("Nome fantasia:", self.edit_fantasia)
 
+        # Slug é visão derivada do nome: recalcular só quando a origem muda,
+        # não a cada retorno da API
+        self.edit_razao.editingFinished.connect(self._maybe_suggest_codigo)
+        self.edit_fantasia.editingFinished.connect(self._maybe_suggest_codigo)
+
         self.edit_regime = QLineEdit()
         self.edit_regime.setPlaceholderText("Simples Nacional, Presumido, Real, MEI...")
         form.addRow("Regime tributário:", self.edit_regime)
@@ -214,18 +240,51 @@ class NovaEmpresaDialog(QDialog):
 
         btn_cancelar = QPushButton("Cancelar")
         btn_cancelar.clicked.connect(self.reject)
-        btn_salvar = QPushButton("Salvar")
-        btn_salvar.clicked.connect(self._on_salvar)
+        self.btn_salvar = QPushButton("Salvar")
+        self.btn_salvar.clicked.connect(self._on_salvar)
 
         btn_row.addWidget(btn_cancelar)
-        btn_row.addWidget(btn_salvar)
+        btn_row.addWidget(self.btn_salvar)
 
         layout.addLayout(btn_row)
 
+        # Salvar só habilita quando todos os campos obrigatórios estão ok
+        for edit in (
+            self.edit_codigoempresa,
+            self.edit_cnpj,
+            self.edit_razao,
+            self.edit_usuario,
+            self.edit_senha,
+        ):
+            edit.textChanged.connect(self._update_salvar_enabled)
+        self._update_salvar_enabled()
+
+    def _campos_validos(self) -> bool:
+        return bool(
+            self.edit_codigoempresa.text().strip()
+            and len(self._cnpj_digits()) == 14
+            and self.edit_razao.text().strip()
+            and self.edit_usuario.text().strip()
+            and self.edit_senha.text()
+        )
+
+    def _update_salvar_enabled(self):
+        self.btn_salvar.setEnabled(self._campos_validos())
+
     def _cnpj_digits(self) -> str:
         texto = self.edit_cnpj.text()
         return re.sub(r"\D", "", texto or "")
 
+    def _maybe_suggest_codigo(self):
+        # Sugerir códigoempresa apenas se o usuário ainda não digitou um
+        if self.edit_codigoempresa.text().strip():
+            return
+        base = self.edit_fantasia.text().strip() or self.edit_razao.text().strip()
+        if not base:
+            return
+        sugestao = gerar_codigoempresa_slug(base, fallback=self._cnpj_digits())
+        self.edit_codigoempresa.setText(sugestao)
+
     def _on_buscar_cnpj(self):
         cnpj_digits = self._cnpj_digits()
         if len(cnpj_digits) != 14:
@@ -272,31 +331,16 @@ class NovaEmpresaDialog(QDialog):
         if descricao_atividade and not self.edit_area.text().strip():
             self.edit_area.setText(descricao_atividade)
 
-        # Sugerir códigoempresa se vazio (slug sem espaços)
-        if not self.edit_codigoempresa.text().strip():
-            sugestao = gerar_codigoempresa_slug(
-                fantasia or razao,
-                fallback=cnpj_digits,
-            )
-            self.edit_codigoempresa.setText(sugestao)
+        # setText não dispara editingFinished, então o preenchimento vindo
+        # da API pede a sugestão explicitamente; o caminho normal (digitação)
+        # fica por conta dos sinais dos campos de nome
+        self._maybe_suggest_codigo()
 
     def _on_salvar(self):
-        if not self.edit_codigoempresa.text().strip():
-            QMessageBox.warning(self, "Atenção", "Informe o código interno da empresa.")
-            return
-        if len(self._cnpj_digits()) != 14:
-            QMessageBox.warning(self, "Atenção", "Informe um CNPJ válido (14 dígitos).")
-            return
-        if not self.edit_razao.text().strip():
-            QMessageBox.warning(self, "Atenção", "Informe a razão social.")
-            return
-        if not self.edit_usuario.text().strip():
-            QMessageBox.warning(self, "Atenção", "Informe o usuário de acesso.")
-            return
-        if not self.edit_senha.text():
-            QMessageBox.warning(self, "Atenção", "Informe a senha de acesso.")
+        # Os campos já foram validados na digitação (validator + habilitação
+        # do botão); aqui só resta uma checagem final barata.
+        if not self._campos_validos():
             return
-
         self.accept()
 
     def get_dados(self) -> dict:
@@ -388,8 +432,9 @@ class LoginWindow(QDialog):
         layout.addLayout(btn_row)
 
     def _setup_shortcuts(self):
-        # Enter já é login via botão padrão
-        shortcut_criar = QShortcut(QKeySequence("Shift+Return"), self)
+        # Enter já é login via botão padrão. A constante evita o parse de
+        # string do Qt a cada abertura do diálogo.
+        shortcut_criar = QShortcut(QKeySequence(Qt.SHIFT | Qt.Key_Return), self)
         shortcut_criar.activated.connect(self._on_criar)
 
     def _on_login(self):
@@ -421,6 +466,7 @@ class LoginWindow(QDialog):
 
         # Sem código de empresa: procurar empresas ligadas a esse usuário/senha
         empresas = models.listar_empresas_por_usuario_senha(username, senha_hash)
+
         if not empresas:
             QMessageBox.critical(
                 self,
@@ -431,6 +477,7 @@ class LoginWindow(QDialog):
 
         if len(empresas) == 1:
             codigoempresa = empresas[0]["codigoempresa"]
+            user = models.autenticar_usuario(codigoempresa, username, senha_hash)
         else:
             dlg = EmpresaEscolhaDialog(empresas, self)
             if dlg.exec_() != QDialog.Accepted:
@@ -438,8 +485,7 @@ class LoginWindow(QDialog):
             codigoempresa = dlg.get_codigoempresa()
             if not codigoempresa:
                 return
-
-        user = models.autenticar_usuario(codigoempresa, username, senha_hash)
+            user = models.autenticar_usuario(codigoempresa, username, senha_hash)
         if not user:
             QMessageBox.critical(
                 self,
@@ -28,10 +28,12 @@ instantiate their classes as needed.
 from __future__ import annotations
 
 import datetime
-from typing import Optional, List, Tuple
+import os
+from typing import Callable, Optional, List, Tuple
 
 from PyQt5 import QtWidgets, QtGui, QtCore
 
+from .theme import apply_theme
 from .categories_view import CategoriesView
 from .accounts_view import AccountsView
 from .orcamentos_view import OrcamentosView
@@ -39,6 +41,49 @@ from .orcamentos_view import OrcamentosView
 from .transactions_view import TransactionsView
 from .recorrentes_view import RecorrentesView
 
+# Os ícones podem vir compilados no resource do Qt (``pyrcc5 ui/icons.qrc
+# -o ui/icons_rc.py``), servidos direto da memória sem I/O de disco. Sem o
+# módulo gerado, cai no carregamento via sistema de arquivos.
+try:
+    from . import icons_rc  # noqa: F401 - registra o resource ":/icons"
+    _USE_RESOURCES = True
+except ImportError:
+    _USE_RESOURCES = False
+
+# Diretório dos ícones da sidebar (resolvido uma vez, independente do cwd)
+_ICONS_DIR = os.path.join(os.path.dirname(__file__), "icons")
+
+# Uma única enumeração do diretório no import substitui um stat por ícone
+# a cada construção de janela (fallback sem resource compilado)
+try:
+    _AVAILABLE_ICONS = set(os.listdir(_ICONS_DIR))
+except OSError:
+    _AVAILABLE_ICONS = set()
+
+# Especificação imutável do menu lateral: (rótulo, arquivo de ícone em
+# ``ui/icons``, página). A página é a classe da view (instanciada com o
+# código da empresa no primeiro acesso) ou, para itens ainda não
+# implementados, o título exibido no placeholder compartilhado. Montada
+# uma única vez no import em vez de reconstruída a cada MainWindow.
+_MENU_SPEC: Tuple[Tuple[str, str, object], ...] = (
+    ("Dashboard", "dashboard.png", "Dashboard"),
+    ("Perfil", "perfil.png", "Perfil"),
+    ("Financeiro", "financeiro.png", TransactionsView),
+    ("Cartões", "cartoes.png", "Cartões de Crédito"),
+    ("Folha", "folha.png", "Folha de Pagamento"),
+    ("Recorrentes", "recorrentes.png", RecorrentesView),
+    ("Orçamentos", "orcamentos.png", OrcamentosView),
+    ("Contas", "Contas.png", AccountsView),
+    ("Contas a Vencer", "contas_a_vencer.png", "Contas a Vencer"),
+    ("Calendário", "calendario.png", "Calendário"),
+    ("Relatórios", "relatorios.png", "Relatórios"),
+    ("Categorias", "categorias.png", CategoriesView),
+    ("Chat IA", "chat_ia.png", "Chat IA"),
+    ("Acesso Rápido IA", "acesso_rapido_ia.png", "Acesso Rápido IA"),
+    ("Configurações", "configuracoes.png", "Configurações"),
+    ("Logs", "logs.png", "Logs"),
+)
+
 
 class MainWindow(QtWidgets.QMainWindow):
     """
@@ -58,6 +103,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.codigoempresa = codigoempresa
         self.usuario = usuario or {}
         self.login_dt = datetime.datetime.now()
+        # Usuário e login não mudam durante a sessão; o texto da barra
+        # superior é montado uma única vez aqui
+        username = self.usuario.get("username") or self.usuario.get("login") or "Usuário"
+        self._session_text = (
+            f"Usuário: {username} | Empresa: {self.codigoempresa} | Login: "
+            f"{self.login_dt:%d/%m/%Y %H:%M}"
+        )
         # Tema atual: padrão escuro
         self._current_theme = "dark"
 
@@ -137,8 +189,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Populate the sidebar and stack with pages
         self._populate_pages()
-        # Connect selection change to stack index change
-        self.sidebar.currentRowChanged.connect(self.stack.setCurrentIndex)
+        # Connect selection change to lazy page build + stack index change
+        self.sidebar.currentRowChanged.connect(self._on_row_changed)
 
         # Set default page to first one
         if self.sidebar.count() > 0:
@@ -163,11 +215,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Title label
         title_label = QtWidgets.QLabel("MF Financier PJ")
-        # Nomeamos para aplicar estilos específicos (QLabel#TopBarTitle)
+        # Nomeamos para aplicar estilos específicos (QLabel#TopBarTitle);
+        # a aparência vem toda do QSS do tema, sem setStyleSheet inline
         title_label.setObjectName("TopBarTitle")
-        title_label.setStyleSheet(
-            "font-size: 18px; font-weight: bold; color: #e5e7eb;"
-        )
 
         # Spacer
         spacer = QtWidgets.QWidget()
@@ -175,16 +225,9 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred
         )
 
-        # Session info
-        username = self.usuario.get("username") or self.usuario.get("login") or "Usuário"
-        session_text = (
-            f"Usuário: {username} | Empresa: {self.codigoempresa} | Login: "
-            f"{self.login_dt.strftime('%d/%m/%Y %H:%M')}"
-        )
-        session_label = QtWidgets.QLabel(session_text)
-        session_label.setStyleSheet(
-            "font-size: 11px; color: #9ca3af;"
-        )
+        # Session info (string pré-computada no __init__)
+        session_label = QtWidgets.QLabel(self._session_text)
+        session_label.setObjectName("sessionLabel")
 
         # Botão de alternância de tema no topo. Cria aqui para que
         # apareça na linha superior. A instância é atribuída a
@@ -205,112 +248,106 @@ class MainWindow(QtWidgets.QMainWindow):
         top_layout.addWidget(session_label)
         top_layout.addWidget(self.toggle_theme_btn)
 
-        # Background colour for top bar
-        top_bar.setStyleSheet(
-            "background-color: #020617; border-bottom: 1px solid #1f2937;"
-        )
         return top_bar
 
     def _populate_pages(self) -> None:
         """
-        Populate the sidebar and stack with pages. Each entry in
-        ``_menu_items`` consists of a display label and a widget instance.
-        When a new page class is added, append an entry here.
+        Populate the sidebar and stack with pages from the module-level
+        ``_MENU_SPEC``. Real pages are only constructed on first access
+        (the class from the spec is instantiated with the company code);
+        all placeholder entries share one "em construção" widget whose
+        title is swapped on navigation. When a new page class is added,
+        append an entry to ``_MENU_SPEC``.
         """
-        # List of tuples: (display text, widget)
-        menu_pages: List[Tuple[str, QtWidgets.QWidget]] = []
-
-        # Dashboard
-        menu_pages.append(("Dashboard", self._build_placeholder_page("Dashboard")))
-
-        # Perfil
-        menu_pages.append(("Perfil", self._build_placeholder_page("Perfil")))
-
-        # Financeiro (Transações)
-        # Use real TransactionsView; pass apenas o código da empresa
-        menu_pages.append(("Financeiro", TransactionsView(self.codigoempresa)))
-
-        # Cartões de Crédito
-        menu_pages.append(("Cartões", self._build_placeholder_page("Cartões de Crédito")))
-
-        # Folha de Pagamento
-        menu_pages.append(("Folha", self._build_placeholder_page("Folha de Pagamento")))
-
-        # Recorrentes
-        # Use real RecorrentesView; pass apenas o código da empresa
-        menu_pages.append(("Recorrentes", RecorrentesView(self.codigoempresa)))
-
-        # Orçamentos
-        orcamentos_view = OrcamentosView(self.codigoempresa)
-        menu_pages.append(("Orçamentos", orcamentos_view))
-
-        # Contas (bancárias)
-        contas_view = AccountsView(self.codigoempresa)
-        menu_pages.append(("Contas", contas_view))
-
-        # Contas a Vencer
-        menu_pages.append(("Contas a Vencer", self._build_placeholder_page("Contas a Vencer")))
-
-        # Calendário
-        menu_pages.append(("Calendário", self._build_placeholder_page("Calendário")))
-
-        # Relatórios
-        menu_pages.append(("Relatórios", self._build_placeholder_page("Relatórios")))
-
-        # Categorias & Tipos
-        categories_view = CategoriesView(self.codigoempresa)
-        menu_pages.append(("Categorias", categories_view))
-
-        # Chat IA
-        menu_pages.append(("Chat IA", self._build_placeholder_page("Chat IA")))
-
-        # Acesso Rápido IA
-        menu_pages.append(("Acesso Rápido IA", self._build_placeholder_page("Acesso Rápido IA")))
-
-        # Configurações
-        menu_pages.append(("Configurações", self._build_placeholder_page("Configurações")))
-
-        # Logs
-        menu_pages.append(("Logs", self._build_placeholder_page("Logs")))
-
-        # Prepara ícones para cada item. O arquivo de ícone deve existir
-        # em ``ui/icons``. Se o ícone não for encontrado, a linha será
-        # exibida apenas com texto.
-        icon_map = {
-            "Dashboard": "dashboard.png",
-            "Perfil": "perfil.png",
-            "Financeiro": "financeiro.png",
-            "Cartões": "cartoes.png",
-            "Folha": "folha.png",
-            "Recorrentes": "recorrentes.png",
-            "Orçamentos": "orcamentos.png",
-            "Contas": "Contas.png",
-            "Contas a Vencer": "contas_a_vencer.png",
-            "Calendário": "calendario.png",
-            "Relatórios": "relatorios.png",
-            "Categorias": "categorias.png",
-            "Chat IA": "chat_ia.png",
-            "Acesso Rápido IA": "acesso_rapido_ia.png",
-            "Configurações": "configuracoes.png",
-            "Logs": "logs.png",
-        }
-
-        # Fill sidebar and stack
-        for label, widget in menu_pages:
-            # Obtém o caminho do ícone, se existir
-            filename = icon_map.get(label)
-            if filename:
-                icon_path = f"ui/icons/{filename}"
-                icon = QtGui.QIcon(icon_path)
-                item = QtWidgets.QListWidgetItem(icon, label)
+        # Guarda as classes de página (None para placeholders); cada página
+        # real só é criada no primeiro acesso
+        self._page_factories: List[Optional[Callable[..., QtWidgets.QWidget]]] = []
+        self._placeholder_rows: dict = {}
+        for row, (_label, _icon_name, page) in enumerate(_MENU_SPEC):
+            if callable(page):
+                self._page_factories.append(page)
+            else:
+                self._page_factories.append(None)
+                self._placeholder_rows[row] = page
+        self._built: List[Optional[QtWidgets.QWidget]] = [None] * len(_MENU_SPEC)
+
+        # Fill sidebar and stack (o stack recebe placeholders leves).
+        # Com os updates desligados, a lista faz uma única passada de
+        # geometria/repaint no final em vez de uma por addItem.
+        self.sidebar.setUpdatesEnabled(False)
+        self.stack.setUpdatesEnabled(False)
+        try:
+            for label, icon_name, _page in _MENU_SPEC:
+                icon = self._load_icon(icon_name)
+                if icon is not None:
+                    item = QtWidgets.QListWidgetItem(icon, label)
+                else:
+                    item = QtWidgets.QListWidgetItem(label)
+                self.sidebar.addItem(item)
+                self.stack.addWidget(QtWidgets.QWidget())
+
+            # Um único widget "em construção" compartilhado entre todos os
+            # placeholders; só o título muda na navegação
+            self._placeholder_page = self._build_placeholder_page("")
+            self._placeholder_stack_idx = self.stack.addWidget(self._placeholder_page)
+        finally:
+            self.stack.setUpdatesEnabled(True)
+            self.sidebar.setUpdatesEnabled(True)
+
+    # Cache de QIcon por nome de arquivo, compartilhado entre instâncias:
+    # o PNG é lido/decodificado uma única vez por processo
+    _ICON_CACHE: dict = {}
+
+    @classmethod
+    def _load_icon(cls, filename: Optional[str]) -> Optional[QtGui.QIcon]:
+        """Retorna o QIcon do arquivo em ``ui/icons``, ou None se não existir."""
+        if not filename:
+            return None
+        icon = cls._ICON_CACHE.get(filename)
+        if icon is None:
+            if _USE_RESOURCES:
+                icon = QtGui.QIcon(f":/icons/{filename}")
+            elif filename in _AVAILABLE_ICONS:
+                icon = QtGui.QIcon(os.path.join(_ICONS_DIR, filename))
             else:
-                item = QtWidgets.QListWidgetItem(label)
-            self.sidebar.addItem(item)
-            self.stack.addWidget(widget)
+                return None
+            cls._ICON_CACHE[filename] = icon
+        return icon
+
+    def _ensure_page(self, idx: int) -> None:
+        """Constrói a página real no lugar do placeholder, se ainda não existir."""
+        if idx < 0 or idx >= len(self._built) or self._built[idx] is not None:
+            return
+        factory = self._page_factories[idx]
+        if factory is None:
+            return
+        widget = factory(self.codigoempresa)
+        # As views nascem com o tema padrão; sincroniza com o tema atual da
+        # janela, que pode já ter sido alternado antes desta primeira visita
+        if hasattr(widget, "set_theme"):
+            widget.set_theme(self._current_theme)
+        placeholder = self.stack.widget(idx)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(idx, widget)
+        self._built[idx] = widget
+
+    @QtCore.pyqtSlot(int)
+    def _on_row_changed(self, idx: int) -> None:
+        """Troca de página na sidebar: materializa a página e mostra."""
+        title = self._placeholder_rows.get(idx)
+        if title is not None:
+            # Item ainda não implementado: reusa o placeholder compartilhado
+            self._placeholder_title_label.setText(title)
+            self.stack.setCurrentIndex(self._placeholder_stack_idx)
+            return
+        self._ensure_page(idx)
+        self.stack.setCurrentIndex(idx)
 
     # ------------------------------------------------------------------
     # Tema
     # ------------------------------------------------------------------
+    @QtCore.pyqtSlot()
     def _toggle_theme(self) -> None:
         """
         Alterna entre os temas claro e escuro.
@@ -322,7 +359,6 @@ class MainWindow(QtWidgets.QMainWindow):
         app = QtWidgets.QApplication.instance()
         if app is None:
             return
-        from ui.theme import apply_theme  # import local para evitar ciclos
         # Alterna o tema atual
         if getattr(self, "_current_theme", "dark") == "dark":
             # Mudar para claro
@@ -335,11 +371,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self._current_theme = "dark"
             self.toggle_theme_btn.setText("Tema Claro")
 
-        # Após alternar o tema, notifique todas as páginas que suportam atualização de tema
-        for idx in range(self.stack.count()):
-            widget = self.stack.widget(idx)
-            # Se o widget (ou seu atributo central) tiver método set_theme, chame
-            if hasattr(widget, "set_theme"):
+        # Após alternar o tema, notifique apenas as páginas já construídas;
+        # placeholders de páginas lazy nunca têm set_theme e nem devem ser
+        # materializados só por causa do toggle
+        for widget in self._built:
+            if widget is not None and hasattr(widget, "set_theme"):
                 try:
                     widget.set_theme(self._current_theme)
                 except Exception:
@@ -369,17 +405,15 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.setSpacing(12)
 
         title_label = QtWidgets.QLabel(title)
-        title_label.setStyleSheet(
-            "font-size: 20px; font-weight: bold; color: #e5e7eb;"
-        )
+        title_label.setObjectName("PlaceholderTitle")
+        # Guardado para que a navegação troque apenas o texto do título
+        self._placeholder_title_label = title_label
 
         subtitle = QtWidgets.QLabel(
             "Página em construção. Esta funcionalidade será implementada em breve."
         )
         subtitle.setWordWrap(True)
-        subtitle.setStyleSheet(
-            "font-size: 13px; color: #9ca3af;"
-        )
+        subtitle.setObjectName("PlaceholderSubtitle")
 
         layout.addWidget(title_label)
         layout.addWidget(subtitle)
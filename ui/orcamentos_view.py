@@ -59,13 +59,14 @@ class OrcamentoDialog(QtWidgets.QDialog):
         self.categorias = listar_categorias(self.codigoempresa)
         for cat in self.categorias:
             self.combo_categoria.addItem(cat.get("nome", ""), cat)
+        # Índice id -> posição no combo, para seleção O(1) em vez de varrer
+        # a lista inteira a cada abertura do diálogo
+        self._cat_index = {c.get("id"): i for i, c in enumerate(self.categorias)}
         if self.orcamento:
             # Set current category
-            cat_id = self.orcamento.get("categoria_id")
-            for idx, cat in enumerate(self.categorias):
-                if cat.get("id") == cat_id:
-                    self.combo_categoria.setCurrentIndex(idx)
-                    break
+            idx = self._cat_index.get(self.orcamento.get("categoria_id"))
+            if idx is not None:
+                self.combo_categoria.setCurrentIndex(idx)
         form.addRow("Categoria:", self.combo_categoria)
 
         # Mês/Ano
@@ -110,6 +111,7 @@ class OrcamentoDialog(QtWidgets.QDialog):
         btn_row.addWidget(btn_save)
         layout.addLayout(btn_row)
 
+    @QtCore.pyqtSlot()
     def _on_save(self) -> None:
         # Collect values
         cat_idx = self.combo_categoria.currentIndex()
@@ -140,6 +142,88 @@ class OrcamentoDialog(QtWidgets.QDialog):
         self.accept()
 
 
+class _LoaderSignals(QtCore.QObject):
+    loaded = QtCore.pyqtSignal(list)
+    failed = QtCore.pyqtSignal(str)
+
+
+class _OrcamentosLoader(QtCore.QRunnable):
+    """
+    Executa ``listar_orcamentos`` fora da thread de UI. Cada chamada da
+    camada de modelos abre sua própria conexão SQLite, então a consulta é
+    segura em outra thread; o resultado volta por sinal na thread da UI.
+    """
+
+    def __init__(self, codigoempresa: str) -> None:
+        super().__init__()
+        self.codigoempresa = codigoempresa
+        self.signals = _LoaderSignals()
+
+    def run(self) -> None:
+        # O QMessageBox precisa da thread da UI, então o erro volta por
+        # sinal em vez de ser tratado aqui
+        try:
+            rows = listar_orcamentos(self.codigoempresa)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.loaded.emit(rows)
+
+
+class OrcamentosModel(QtCore.QAbstractTableModel):
+    """
+    Modelo somente leitura sobre a lista de dicts retornada por
+    ``listar_orcamentos``. Recarregar vira um único reset de modelo, sem
+    alocar um QTableWidgetItem por célula.
+    """
+
+    HEADERS = ("ID", "Categoria", "Mês/Ano", "Valor")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            # Formatar só quando a célula é consultada: o viewport pede
+            # apenas as linhas visíveis, então o resto da lista nunca paga
+            # pelo f-string do valor
+            orc = self._rows[index.row()]
+            col = index.column()
+            if col == 0:
+                return str(orc.get("id"))
+            if col == 1:
+                return orc.get("categoria_nome") or ""
+            if col == 2:
+                return orc.get("mes_ano") or ""
+            return f"{orc.get('valor') or 0:.2f}"
+        return None
+
+    def orcamento_at(self, row: int) -> Optional[dict]:
+        """Dict original do orçamento na linha, sem passar por QVariant."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def headerData(self, section: int, orientation, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class OrcamentosView(QtWidgets.QWidget):
     """
     Página para gerenciamento de orçamentos. Exibe todos os orçamentos
@@ -149,6 +233,8 @@ class OrcamentosView(QtWidgets.QWidget):
     def __init__(self, codigoempresa: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.codigoempresa = codigoempresa
+        # Quando True, a tabela precisa ser recarregada na próxima exibição
+        self._dirty = True
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -161,12 +247,16 @@ class OrcamentosView(QtWidgets.QWidget):
         layout.addWidget(title)
 
         # Table: ID, Categoria, Mês/Ano, Valor
-        self.table = QtWidgets.QTableWidget(0, 4)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Categoria", "Mês/Ano", "Valor",
-        ])
+        self.table = QtWidgets.QTableView()
+        self.model = OrcamentosModel(self)
+        self.table.setModel(self.model)
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        # Stretch em todas as colunas força recálculo de largura a cada
+        # inserção; só Categoria estica, as demais seguem o conteúdo
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QtWidgets.QHeaderView.ResizeToContents)
         self.table.setSelectionBehavior(
             QtWidgets.QAbstractItemView.SelectRows
         )
@@ -190,37 +280,61 @@ class OrcamentosView(QtWidgets.QWidget):
         btn_edit.clicked.connect(self._edit_orcamento)
         btn_del.clicked.connect(self._delete_orcamento)
 
-        self._carregar_orcamentos()
+    def showEvent(self, event) -> None:
+        # Recarrega apenas quando a página fica visível e há dados pendentes,
+        # evitando rebuilds de tabela enquanto a view está fora de tela
+        super().showEvent(event)
+        if self._dirty:
+            self._do_load()
+            self._dirty = False
 
     def _carregar_orcamentos(self) -> None:
-        orcamentos = listar_orcamentos(self.codigoempresa)
-        self.table.setRowCount(len(orcamentos))
-        for row_idx, orc in enumerate(orcamentos):
-            items = [
-                str(orc.get("id")),
-                orc.get("categoria_nome") or "",
-                orc.get("mes_ano") or "",
-                f"{orc.get('valor') or 0:.2f}",
-            ]
-            for col, val in enumerate(items):
-                item = QtWidgets.QTableWidgetItem(val)
-                if col == 0:
-                    item.setData(QtCore.Qt.UserRole, orc)
-                self.table.setItem(row_idx, col, item)
+        if self.isVisible():
+            self._do_load()
+            self._dirty = False
+        else:
+            self._dirty = True
+
+    def _do_load(self) -> None:
+        # A consulta roda no pool global de threads para não bloquear a UI;
+        # as linhas chegam em _apply_rows via sinal
+        loader = _OrcamentosLoader(self.codigoempresa)
+        loader.signals.loaded.connect(self._apply_rows)
+        loader.signals.failed.connect(self._load_failed)
+        self._loader = loader  # mantém viva a QObject dos sinais
+        QtCore.QThreadPool.globalInstance().start(loader)
+
+    @QtCore.pyqtSlot(list)
+    def _apply_rows(self, rows: list) -> None:
+        # O reset do modelo já agrupa as notificações; desligar os updates da
+        # view durante a troca evita repaints intermediários do viewport
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(rows)
+        finally:
+            self.table.setUpdatesEnabled(True)
+
+    @QtCore.pyqtSlot(str)
+    def _load_failed(self, msg: str) -> None:
+        QtWidgets.QMessageBox.critical(
+            self, "Erro", f"Falha ao carregar orçamentos:\n{msg}"
+        )
 
     def _get_selected_orcamento(self) -> Optional[dict]:
         rows = self.table.selectionModel().selectedRows()
         if not rows:
             return None
-        row_idx = rows[0].row()
-        item = self.table.item(row_idx, 0)
-        return item.data(QtCore.Qt.UserRole)
+        # O índice da linha basta para identificar o registro; nada de
+        # empacotar o dict inteiro em QVariant via UserRole
+        return self.model.orcamento_at(rows[0].row())
 
+    @QtCore.pyqtSlot()
     def _add_orcamento(self) -> None:
         dlg = OrcamentoDialog(self.codigoempresa, self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
             self._carregar_orcamentos()
 
+    @QtCore.pyqtSlot()
     def _edit_orcamento(self) -> None:
         orc = self._get_selected_orcamento()
         if not orc:
@@ -232,6 +346,7 @@ class OrcamentosView(QtWidgets.QWidget):
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
             self._carregar_orcamentos()
 
+    @QtCore.pyqtSlot()
     def _delete_orcamento(self) -> None:
         orc = self._get_selected_orcamento()
         if not orc:
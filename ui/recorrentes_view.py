@@ -25,6 +25,13 @@ try:
 except ImportError:
     import models  # type: ignore
 
+# Combos e linhas de info usam as mesmas listas de referência das demais
+# telas; o cache compartilhado é invalidado pelas telas de cadastro
+try:
+    from . import _refdata_cache
+except ImportError:
+    import _refdata_cache  # type: ignore
+
 
 class RecorrenteDialog(QtWidgets.QDialog):
     """Dialog to create or edit a recurring transaction."""
@@ -40,9 +47,10 @@ class RecorrenteDialog(QtWidgets.QDialog):
         self.recorrente = recorrente or {}
         self.setWindowTitle("Recorrente")
         self.setModal(True)
+        # Combos são preenchidos depois do primeiro paint (ver showEvent)
+        self._combos_preenchidos = False
 
         self._build_ui()
-        self._populate_fields()
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QFormLayout(self)
@@ -57,16 +65,12 @@ class RecorrenteDialog(QtWidgets.QDialog):
         self.combo_categoria = QtWidgets.QComboBox()
         self.combo_categoria.setEditable(False)
         self.combo_categoria.addItem("-- Selecione --", None)
-        for cat in models.listar_categorias(self.codigoempresa):
-            self.combo_categoria.addItem(cat["nome"], cat["id"])
         layout.addRow("Categoria:", self.combo_categoria)
 
         # Centro de custo
         self.combo_centro = QtWidgets.QComboBox()
         self.combo_centro.setEditable(False)
         self.combo_centro.addItem("-- Nenhum --", None)
-        for cc in models.listar_centros_custo(self.codigoempresa):
-            self.combo_centro.addItem(cc["nome"], cc["id"])
         layout.addRow("Centro de Custo:", self.combo_centro)
 
         # Valor
@@ -110,6 +114,25 @@ class RecorrenteDialog(QtWidgets.QDialog):
         btn_box.rejected.connect(self.reject)
         layout.addRow(btn_box)
 
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        # Mostra o diálogo imediatamente e preenche os combos (e os campos,
+        # no modo edição) no próximo giro do event loop
+        if not self._combos_preenchidos:
+            self._combos_preenchidos = True
+            QtCore.QTimer.singleShot(0, self._populate_combos)
+
+    def _populate_combos(self) -> None:
+        self.setUpdatesEnabled(False)
+        try:
+            for cat_id, nome in _refdata_cache.categorias(self.codigoempresa):
+                self.combo_categoria.addItem(nome, cat_id)
+            for cc_id, nome in _refdata_cache.centros_custo(self.codigoempresa):
+                self.combo_centro.addItem(nome, cc_id)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._populate_fields()
+
     def _populate_fields(self) -> None:
         r = self.recorrente
         if not r:
@@ -213,6 +236,227 @@ class RecorrenteDialog(QtWidgets.QDialog):
         self.accept()
 
 
+class _RecsLoaderSignals(QtCore.QObject):
+    # recs, (cat_map, cc_map)
+    loaded = QtCore.pyqtSignal(list, object)
+    failed = QtCore.pyqtSignal(str)
+
+
+class _RecorrentesLoader(QtCore.QRunnable):
+    """
+    Executa ``listar_recorrentes`` (e as consultas de categoria/centro,
+    quando não estão no cache compartilhado) fora da thread de UI. Cada
+    chamada da camada de modelos abre sua própria conexão SQLite, então
+    as consultas são seguras em outra thread; o resultado volta por
+    sinal na thread da UI.
+    """
+
+    def __init__(self, codigoempresa: str) -> None:
+        super().__init__()
+        self.codigoempresa = codigoempresa
+        self.signals = _RecsLoaderSignals()
+
+    def run(self) -> None:
+        # O QMessageBox precisa da thread da UI, então o erro volta por
+        # sinal em vez de ser tratado aqui
+        try:
+            recs = models.listar_recorrentes(self.codigoempresa)
+            # Quase sempre resolve direto do lru_cache; só vai ao banco
+            # quando uma tela de cadastro invalidou o cache
+            cat_map = dict(_refdata_cache.categorias(self.codigoempresa))
+            cc_map = dict(_refdata_cache.centros_custo(self.codigoempresa))
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.loaded.emit(recs, (cat_map, cc_map))
+
+
+class RecorrentesModel(QtCore.QAbstractListModel):
+    """
+    Modelo de lista sobre os dicts de ``listar_recorrentes``. O delegate
+    pinta cada cartão a partir do dict exposto em ``Qt.UserRole``; não há
+    árvore de widgets por registro.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if index.isValid() and role == QtCore.Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def row_dict(self, row: int) -> Optional[dict]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+
+class RecorrenteCardDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Pinta um cartão de recorrente (barra colorida, descrição, valor, linha
+    de info e ações) direto com QPainter. Só as linhas visíveis no viewport
+    pagam custo de renderização, independente do tamanho da lista.
+    """
+
+    edit_requested = QtCore.pyqtSignal(int)
+    delete_requested = QtCore.pyqtSignal(int)
+
+    CARD_HEIGHT = 96
+    BAR_WIDTH = 6
+    BTN_WIDTH = 60
+    BTN_HEIGHT = 22
+    MARGIN_V = 4
+
+    # QColors construídos uma vez na definição da classe — o paint() só
+    # faz lookup, sem parsear hex por linha visível a cada repaint
+    _PALETTES = {
+        "dark": {
+            "card": QtGui.QColor("#0f172a"),
+            "header": QtGui.QColor("#e5e7eb"),
+            "info": QtGui.QColor("#9ca3af"),
+        },
+        "light": {
+            "card": QtGui.QColor("#ffffff"),
+            "header": QtGui.QColor("#111827"),
+            "info": QtGui.QColor("#6b7280"),
+        },
+    }
+    _COLOR_POS = QtGui.QColor("#22c55e")
+    _COLOR_NEG = QtGui.QColor("#ef4444")
+    _COLOR_NEUTRO = QtGui.QColor("#6b7280")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, theme: str = "dark") -> None:
+        super().__init__(parent)
+        self.theme = theme
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        return QtCore.QSize(200, self.CARD_HEIGHT)
+
+    def _card_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        return rect.adjusted(0, self.MARGIN_V, 0, -self.MARGIN_V)
+
+    def _btn_rects(self, card_rect: QtCore.QRect) -> tuple:
+        y = card_rect.bottom() - self.BTN_HEIGHT - 6
+        edit = QtCore.QRect(
+            card_rect.left() + self.BAR_WIDTH + 12, y, self.BTN_WIDTH, self.BTN_HEIGHT
+        )
+        delete = QtCore.QRect(edit.right() + 8, y, self.BTN_WIDTH, self.BTN_HEIGHT)
+        return edit, delete
+
+    @classmethod
+    def _bar_pixmap(cls, color: QtGui.QColor, height: int) -> QtGui.QPixmap:
+        key = f"recbar-{color.name()}-{height}"
+        pm = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, pm):
+            pm = QtGui.QPixmap(cls.BAR_WIDTH, height)
+            pm.fill(QtCore.Qt.transparent)
+            p = QtGui.QPainter(pm)
+            p.setRenderHint(QtGui.QPainter.Antialiasing)
+            p.setPen(QtCore.Qt.NoPen)
+            p.setBrush(color)
+            p.drawRoundedRect(0, 0, cls.BAR_WIDTH, height, 3, 3)
+            p.end()
+            QtGui.QPixmapCache.insert(key, pm)
+        return pm
+
+    @classmethod
+    def _valor_color(cls, val, fallback: QtGui.QColor) -> QtGui.QColor:
+        if val is None or val == 0:
+            return fallback
+        return cls._COLOR_POS if val > 0 else cls._COLOR_NEG
+
+    def paint(self, painter: QtGui.QPainter, option, index) -> None:
+        r = index.data(QtCore.Qt.UserRole)
+        if not r:
+            return
+        pal = self._PALETTES.get(self.theme, self._PALETTES["dark"])
+        card_rect = self._card_rect(option.rect)
+        val = r.get("valor")
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+
+        # Fundo do cartão
+        painter.setBrush(pal["card"])
+        painter.drawRoundedRect(card_rect, 8, 8)
+
+        # Barra colorida à esquerda (verde/vermelho/cinza conforme o valor).
+        # O retângulo arredondado é rasterizado uma vez por (cor, altura) no
+        # QPixmapCache; os paints seguintes só blitam o pixmap pronto.
+        bar_color = self._valor_color(val, self._COLOR_NEUTRO)
+        painter.drawPixmap(
+            card_rect.topLeft(), self._bar_pixmap(bar_color, card_rect.height())
+        )
+
+        content_left = card_rect.left() + self.BAR_WIDTH + 12
+        content_width = card_rect.right() - 12 - content_left
+
+        # Cabeçalho: descrição à esquerda, valor à direita
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        header_rect = QtCore.QRect(content_left, card_rect.top() + 6, content_width, 20)
+        painter.setPen(pal["header"])
+        painter.drawText(
+            header_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            r.get("descricao") or "",
+        )
+        painter.setPen(self._valor_color(val, pal["header"]))
+        painter.drawText(
+            header_rect,
+            QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+            r.get("_valor_fmt") or "",
+        )
+
+        # Linha de informações (pré-computada no carregamento)
+        font.setBold(False)
+        painter.setFont(font)
+        info_rect = QtCore.QRect(content_left, header_rect.bottom() + 2, content_width, 16)
+        painter.setPen(pal["info"])
+        painter.drawText(
+            info_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            r.get("_info") or "",
+        )
+
+        # Ações Editar/Excluir como "botões" pintados
+        edit_rect, delete_rect = self._btn_rects(card_rect)
+        painter.setPen(pal["info"])
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRoundedRect(edit_rect, 6, 6)
+        painter.drawRoundedRect(delete_rect, 6, 6)
+        painter.setPen(pal["header"])
+        painter.drawText(edit_rect, QtCore.Qt.AlignCenter, "Editar")
+        painter.drawText(delete_rect, QtCore.Qt.AlignCenter, "Excluir")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            event.type() == QtCore.QEvent.MouseButtonRelease
+            and event.button() == QtCore.Qt.LeftButton
+        ):
+            edit_rect, delete_rect = self._btn_rects(self._card_rect(option.rect))
+            if edit_rect.contains(event.pos()):
+                self.edit_requested.emit(index.row())
+                return True
+            if delete_rect.contains(event.pos()):
+                self.delete_requested.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class RecorrentesView(QtWidgets.QWidget):
     """Widget to list and manage recurring transactions."""
 
@@ -224,48 +468,49 @@ class RecorrentesView(QtWidgets.QWidget):
         self._load_data()
 
     def set_theme(self, theme: str) -> None:
-        """Atualiza o tema atual e recarrega os cartões."""
+        """Atualiza o tema atual repintando os cartões no lugar.
+
+        Trocar o tema não consulta o banco nem reconstrói a lista: basta
+        trocar a paleta do delegate e pedir um repaint do viewport.
+        """
         if theme not in ("dark", "light"):
             return
         self.current_theme = theme
-        # Atualiza cores de título e resumo
-        if hasattr(self, "title"):
-            self.title.setStyleSheet(
-                "font-size: 16px; font-weight: bold; color: {}".format(
-                    "#e5e7eb" if theme == "dark" else "#111827"
-                )
-            )
-        if hasattr(self, "lbl_summary"):
-            sum_color = "#9ca3af" if theme == "dark" else "#6b7280"
-            self.lbl_summary.setStyleSheet(
-                f"font-size: 12px; color: {sum_color};"
-            )
-        self._load_data()
+        # Título e resumo seguem o QSS global do tema (por objectName);
+        # nada a reestilizar aqui
+        if hasattr(self, "card_delegate"):
+            self.card_delegate.theme = theme
+        if hasattr(self, "list_view"):
+            self.list_view.viewport().update()
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(8)
 
-        # Title
+        # Title — estilizado via seletor de objectName no QSS do tema
         self.title = QtWidgets.QLabel("Transações Recorrentes")
-        self.title.setStyleSheet("font-size: 16px; font-weight: bold; color: #e5e7eb;")
+        self.title.setObjectName("RecorrentesTitle")
         layout.addWidget(self.title)
 
         # Summary label for income/expense totals
         self.lbl_summary = QtWidgets.QLabel("")
-        self.lbl_summary.setStyleSheet("font-size: 12px; color: #9ca3af;")
+        self.lbl_summary.setObjectName("RecorrentesSummary")
         layout.addWidget(self.lbl_summary)
 
-        # Área de cartões em scroll
-        self.scroll_area = QtWidgets.QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.cards_container = QtWidgets.QWidget()
-        self.cards_layout = QtWidgets.QVBoxLayout(self.cards_container)
-        self.cards_layout.setContentsMargins(0, 0, 0, 0)
-        self.cards_layout.setSpacing(8)
-        self.scroll_area.setWidget(self.cards_container)
-        layout.addWidget(self.scroll_area)
+        # Lista de cartões renderizada por delegate: nada de uma árvore de
+        # QFrames/QLabels por registro — só as linhas visíveis são pintadas
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.list_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.model = RecorrentesModel(self)
+        self.list_view.setModel(self.model)
+        self.card_delegate = RecorrenteCardDelegate(self.list_view, theme=self.current_theme)
+        self.list_view.setItemDelegate(self.card_delegate)
+        self.card_delegate.edit_requested.connect(self._edit_row)
+        self.card_delegate.delete_requested.connect(self._delete_row)
+        layout.addWidget(self.list_view)
 
         # Botão global para adicionar recorrente
         btn_layout = QtWidgets.QHBoxLayout()
@@ -278,155 +523,76 @@ class RecorrentesView(QtWidgets.QWidget):
         self.btn_add.clicked.connect(self._on_add)
 
     def _load_data(self) -> None:
-        """Carrega todas as transações recorrentes e exibe como cartões."""
-        try:
-            recs = models.listar_recorrentes(self.codigoempresa)
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Erro",
-                f"Falha ao carregar recorrentes:\n{exc}",
-            )
-            return
-        # Totais de receitas e despesas (valores positivos e negativos)
-        total_receitas = sum(r.get("valor", 0) for r in recs if r.get("valor", 0) > 0)
-        total_despesas = sum(-r.get("valor", 0) for r in recs if r.get("valor", 0) < 0)
+        """Dispara o carregamento das recorrentes em segundo plano."""
+        # As consultas rodam no pool global de threads para não congelar a
+        # UI; os dados chegam em _apply_rows via sinal
+        self.lbl_summary.setText("Carregando...")
+        loader = _RecorrentesLoader(self.codigoempresa)
+        loader.signals.loaded.connect(self._apply_rows)
+        loader.signals.failed.connect(self._load_failed)
+        self._loader = loader  # mantém viva a QObject dos sinais
+        QtCore.QThreadPool.globalInstance().start(loader)
+
+    @QtCore.pyqtSlot(str)
+    def _load_failed(self, msg: str) -> None:
+        self.lbl_summary.setText("Receitas: 0.00 | Despesas: 0.00")
+        QtWidgets.QMessageBox.critical(
+            self, "Erro", f"Falha ao carregar recorrentes:\n{msg}"
+        )
+
+    @QtCore.pyqtSlot(list, object)
+    def _apply_rows(self, recs: list, lookups) -> None:
+        cat_map, cc_map = lookups
+        # Totais de receitas e despesas em uma única passada pela lista
+        total_receitas = 0.0
+        total_despesas = 0.0
+        for r in recs:
+            v = r.get("valor")
+            # Valor formatado uma vez por carga; o delegate só lê a string
+            # pronta a cada repaint
+            r["_valor_fmt"] = f"{v:.2f}" if v is not None else ""
+            v = v or 0
+            if v > 0:
+                total_receitas += v
+            elif v < 0:
+                total_despesas -= v
         self.lbl_summary.setText(
             f"Receitas: {total_receitas:.2f} | Despesas: {total_despesas:.2f}"
         )
-        # Remove cartões existentes
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
         for r in recs:
-            # Definir cores base conforme tema
-            if self.current_theme == "light":
-                card_bg = "#ffffff"
-                header_color = "#111827"
-                info_color = "#6b7280"
-            else:
-                card_bg = "#0f172a"
-                header_color = "#e5e7eb"
-                info_color = "#9ca3af"
-            val = r.get("valor")
-            # Outer frame with coloured bar
-            outer_frame = QtWidgets.QFrame()
-            outer_layout = QtWidgets.QHBoxLayout(outer_frame)
-            outer_layout.setContentsMargins(0, 0, 0, 0)
-            outer_layout.setSpacing(0)
-            bar = QtWidgets.QFrame()
-            bar.setFixedWidth(6)
-            if val is not None:
-                if val > 0:
-                    bar_color = "#22c55e"
-                elif val < 0:
-                    bar_color = "#ef4444"
-                else:
-                    bar_color = "#6b7280"
-            else:
-                bar_color = "#6b7280"
-            bar.setStyleSheet(
-                f"background-color: {bar_color}; border-top-left-radius: 8px; border-bottom-left-radius: 8px;"
-            )
-            outer_layout.addWidget(bar)
-            card = QtWidgets.QFrame()
-            card.setStyleSheet(
-                f"background-color: {card_bg}; border-radius: 8px; padding: 8px;"
-            )
-            card_layout = QtWidgets.QVBoxLayout(card)
-            card_layout.setContentsMargins(12, 8, 12, 8)
-            card_layout.setSpacing(4)
-            # Cabeçalho: descrição e valor
-            header_layout = QtWidgets.QHBoxLayout()
-            lbl_desc = QtWidgets.QLabel(r.get("descricao") or "")
-            lbl_desc.setStyleSheet(
-                f"font-size: 14px; font-weight: bold; color: {header_color};"
-            )
-            header_layout.addWidget(lbl_desc)
-            header_layout.addStretch()
-            lbl_val = QtWidgets.QLabel(f"{val:.2f}" if val is not None else "")
-            if val is not None:
-                if val > 0:
-                    val_color = "#22c55e"
-                elif val < 0:
-                    val_color = "#ef4444"
-                else:
-                    val_color = header_color
-            else:
-                val_color = header_color
-            lbl_val.setStyleSheet(
-                f"color: {val_color}; font-size: 14px; font-weight: bold;"
-            )
-            header_layout.addWidget(lbl_val)
-            card_layout.addLayout(header_layout)
-            # Linha info
-            info_parts = []
-            # categoria
-            cat_nome = ""
-            if r.get("categoria_id"):
-                try:
-                    cat = models.buscar_categoria_por_id(r.get("categoria_id"))
-                    cat_nome = cat.get("nome") if cat else ""
-                except Exception:
-                    cat_nome = ""
-            if cat_nome:
-                info_parts.append(f"Categoria: {cat_nome}")
-            # centro de custo
-            centro_nome = ""
-            if r.get("centro_custo_id"):
-                try:
-                    centros = models.listar_centros_custo(self.codigoempresa)
-                    centro = next((cc for cc in centros if cc["id"] == r.get("centro_custo_id")), None)
-                    centro_nome = centro.get("nome") if centro else ""
-                except Exception:
-                    centro_nome = ""
-            if centro_nome:
-                info_parts.append(f"Centro: {centro_nome}")
-            # frequência
-            freq = r.get("frequencia") or ""
-            if freq:
-                info_parts.append(f"Freq: {freq}")
-            # próxima
-            prox = r.get("proxima_data") or ""
-            if prox:
-                info_parts.append(f"Próx: {prox}")
-            # fim
-            fim = r.get("data_final") or r.get("data_fim") or ""
-            if fim:
-                info_parts.append(f"Fim: {fim}")
-            # forma
-            forma = r.get("forma_pagamento") or ""
-            if forma:
-                info_parts.append(f"Forma: {forma}")
-            # ativo
-            ativo = r.get("ativo")
-            info_parts.append("Ativo" if ativo else "Inativo")
-            lbl_info = QtWidgets.QLabel("  |  ".join(info_parts))
-            lbl_info.setStyleSheet(
-                f"font-size: 11px; color: {info_color};"
-            )
-            card_layout.addWidget(lbl_info)
-            # Botões de ação: Editar e Excluir
-            btn_layout = QtWidgets.QHBoxLayout()
-            btn_edit = QtWidgets.QPushButton("Editar")
-            btn_edit.setFixedWidth(60)
-            btn_delete = QtWidgets.QPushButton("Excluir")
-            btn_delete.setFixedWidth(60)
-            btn_layout.addWidget(btn_edit)
-            btn_layout.addWidget(btn_delete)
-            btn_layout.addStretch()
-            card_layout.addLayout(btn_layout)
-            # Conecta ações
-            btn_edit.clicked.connect(lambda _=False, d=r: self._edit_card(d))
-            btn_delete.clicked.connect(lambda _=False, d=r: self._delete_card(d))
-            # Finaliza outer layout
-            outer_layout.addWidget(card)
-            # Adiciona cartão
-            self.cards_layout.addWidget(outer_frame)
-        # Spacer
-        self.cards_layout.addStretch()
+            r["_info"] = self._build_info_line(r, cat_map, cc_map)
+        # Suspende a pintura durante o reset do modelo: uma única
+        # relayout/repaint ao final, em vez de uma por sinal intermediário
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            self.model.set_rows(recs)
+        finally:
+            self.list_view.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _build_info_line(r: dict, cat_map: dict, cc_map: dict) -> str:
+        """Monta a linha de informações exibida no cartão."""
+        info_parts = []
+        cat_nome = cat_map.get(r.get("categoria_id"), "")
+        if cat_nome:
+            info_parts.append(f"Categoria: {cat_nome}")
+        centro_nome = cc_map.get(r.get("centro_custo_id"), "")
+        if centro_nome:
+            info_parts.append(f"Centro: {centro_nome}")
+        freq = r.get("frequencia") or ""
+        if freq:
+            info_parts.append(f"Freq: {freq}")
+        prox = r.get("proxima_data") or ""
+        if prox:
+            info_parts.append(f"Próx: {prox}")
+        fim = r.get("data_final") or r.get("data_fim") or ""
+        if fim:
+            info_parts.append(f"Fim: {fim}")
+        forma = r.get("forma_pagamento") or ""
+        if forma:
+            info_parts.append(f"Forma: {forma}")
+        info_parts.append("Ativo" if r.get("ativo") else "Inativo")
+        return "  |  ".join(info_parts)
 
     def _on_add(self) -> None:
         """Abre a caixa de diálogo para criar uma nova recorrência e recarrega os dados."""
@@ -437,6 +603,18 @@ class RecorrentesView(QtWidgets.QWidget):
     # ------------------------------------------------------------------
     # Card-based actions
     # ------------------------------------------------------------------
+    @QtCore.pyqtSlot(int)
+    def _edit_row(self, row: int) -> None:
+        rec = self.model.row_dict(row)
+        if rec is not None:
+            self._edit_card(rec)
+
+    @QtCore.pyqtSlot(int)
+    def _delete_row(self, row: int) -> None:
+        rec = self.model.row_dict(row)
+        if rec is not None:
+            self._delete_card(rec)
+
     def _edit_card(self, rec: dict) -> None:
         """Abre a caixa de diálogo para editar uma recorrência específica."""
         dlg = RecorrenteDialog(self.codigoempresa, rec, self)
@@ -1,166 +1,50 @@
+import re
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
+
+from PyQt5 import QtCore
 from PyQt5.QtWidgets import QApplication
 from core.config import BASE_DIR
 
-# Fallback QSS definitions in case theme files cannot be loaded.
-# These strings are simplified versions of the dark and light themes used
-# in the original MF Financier. They ensure that even se o sistema não
-# encontrar os arquivos ``dark.qss`` ou ``light.qss``, um tema
-# consistente ainda será aplicado.
-DARK_FALLBACK = """
-/* Tema escuro padrão */
-QWidget {
-    background-color: #020617;
-    color: #e5e7eb;
-    font-family: "Segoe UI";
-    font-size: 10pt;
-}
-
-QFrame#TopBar {
-    background-color: #020617;
-    border-bottom: 1px solid #1e293b;
-}
-
-QFrame#Sidebar {
-    background-color: #020617;
-    border-right: 1px solid #1e2937;
-}
-
-QPushButton {
-    background-color: #0f172a;
-    color: #e5e7eb;
-    border-radius: 8px;
-    padding: 6px 10px;
-    border: 1px solid #1f2937;
-}
-QPushButton:hover {
-    background-color: #111827;
-}
-QPushButton:pressed {
-    background-color: #1f2937;
-}
-
-QLineEdit, QComboBox, QSpinBox, QDateEdit {
-    background-color: #020617;
-    border: 1px solid #1f2937;
-    border-radius: 6px;
-    padding: 4px 6px;
-    selection-background-color: #2563eb;
-    selection-color: #f9fafb;
-}
-
-QTableWidget {
-    background-color: #020617;
-    gridline-color: #273549;
-    border-radius: 10px;
-    border: 1px solid #1e293b;
-}
-
-QHeaderView::section {
-    background-color: #0b1120;
-    color: #e5e7eb;
-    padding: 6px 4px;
-    border: none;
-    border-bottom: 1px solid #1f2937;
-}
-
-QDialog {
-    background-color: #020617;
-    border-radius: 12px;
-}
-
-/* Customize list widgets in the sidebar for dark theme */
-QListWidget {
-    background-color: #020617;
-    color: #e5e7eb;
-    border: none;
-}
-QListWidget::item {
-    padding: 10px 14px;
-}
-QListWidget::item:selected {
-    background-color: #0f172a;
-    color: #ffffff;
-}
-
-"""
-
-LIGHT_FALLBACK = """
-/* Tema claro padrão */
-QWidget {
-    background-color: #f9fafb;
-    color: #111827;
-    font-family: "Segoe UI";
-    font-size: 10pt;
-}
-
-QFrame#TopBar {
-    background-color: #f3f4f6;
-    border-bottom: 1px solid #d1d5db;
-}
-
-QFrame#Sidebar {
-    background-color: #f9fafb;
-    border-right: 1px solid #d1d5db;
-}
-
-QPushButton {
-    background-color: #ffffff;
-    color: #111827;
-    border-radius: 8px;
-    padding: 6px 10px;
-    border: 1px solid #d1d5db;
-}
-QPushButton:hover {
-    background-color: #f3f4f6;
-}
-QPushButton:pressed {
-    background-color: #e5e7eb;
-}
-
-QLineEdit, QComboBox, QSpinBox, QDateEdit {
-    background-color: #ffffff;
-    border: 1px solid #d1d5db;
-    border-radius: 6px;
-    padding: 4px 6px;
-    selection-background-color: #2563eb;
-    selection-color: #f9fafb;
-}
-
-QTableWidget {
-    background-color: #ffffff;
-    gridline-color: #e5e7eb;
-    border-radius: 10px;
-    border: 1px solid #e5e7eb;
-}
-
-QHeaderView::section {
-    background-color: #f3f4f6;
-    color: #111827;
-    padding: 6px 4px;
-    border: none;
-    border-bottom: 1px solid #e5e7eb;
-}
-
-QDialog {
-    background-color: #f9fafb;
-    border-radius: 12px;
-}
-
-/* Customize list widgets in the sidebar for light theme */
-QListWidget {
-    background-color: #f9fafb;
-    color: #111827;
-    border: none;
-}
-QListWidget::item {
-    padding: 10px 14px;
-}
-QListWidget::item:selected {
-    background-color: #e5e7eb;
-    color: #111827;
-}
-"""
+# Módulo gerado pelo pyrcc5 a partir de ``ui/themes.qrc`` (``pyrcc5
+# ui/themes.qrc -o ui/themes_rc.py``). Com ele presente, os QSS são lidos
+# da memória sem nenhum stat/read de disco; sem ele, caímos na busca em
+# ``resources/``.
+try:
+    from . import themes_rc  # noqa: F401 - registra o resource ":/themes"
+    _USE_RESOURCES = True
+except Exception:
+    _USE_RESOURCES = False
+
+
+# Pastas candidatas fixas, computadas uma vez no import. O cwd fica de
+# fora porque pode mudar durante a execução — entra só na hora da busca.
+_CANDIDATE_DIRS = [
+    BASE_DIR / "resources",
+    BASE_DIR.parent / "resources",
+    BASE_DIR.parent.parent / "resources",
+]
+
+# Caminho resolvido de cada arquivo QSS após a primeira busca bem-sucedida;
+# os próximos carregamentos pulam a sondagem das pastas candidatas
+_QSS_PATH_CACHE: dict = {}
+
+
+def _fallback_qss(theme: str) -> str:
+    """
+    Carrega o QSS de fallback empacotado em ``ui/themes``.
+
+    São versões simplificadas dos temas completos: garantem um visual
+    consistente mesmo se os arquivos de ``resources/`` não forem
+    encontrados. Ficam em arquivos ``.qss`` (e não em constantes Python)
+    para que o import do módulo não carregue ~4 KB de strings que na
+    maioria das execuções nunca são usadas.
+    """
+    try:
+        return (files("ui.themes") / f"{theme}.qss").read_text(encoding="utf-8")
+    except Exception:
+        return ""
 
 
 def _load_qss(filename: str) -> str:
@@ -189,33 +73,62 @@ def _load_qss(filename: str) -> str:
         Conteúdo do QSS encontrado ou uma string vazia se nenhum
         arquivo válido for localizado.
     """
-    from pathlib import Path
-
-    # Lista de diretórios para procurar o QSS
-    candidate_dirs = [
-        BASE_DIR / "resources",
-        BASE_DIR.parent / "resources",
-        BASE_DIR.parent.parent / "resources",
-        Path.cwd() / "resources",
-    ]
-    for dir_path in candidate_dirs:
+    # Resource embutido: zero syscalls depois que o processo sobe
+    if _USE_RESOURCES:
+        f = QtCore.QFile(f":/themes/{filename}")
+        if f.open(QtCore.QIODevice.ReadOnly):
+            try:
+                return bytes(f.readAll()).decode("utf-8")
+            finally:
+                f.close()
+
+    # Caminho já resolvido para esse arquivo? Pula a sondagem de diretórios
+    cached_path = _QSS_PATH_CACHE.get(filename)
+    if cached_path is not None:
+        try:
+            return cached_path.read_text(encoding="utf-8")
+        except Exception:
+            _QSS_PATH_CACHE.pop(filename, None)
+
+    for dir_path in _CANDIDATE_DIRS + [Path.cwd() / "resources"]:
         qss_path = dir_path / filename
         if qss_path.exists():
             try:
-                return qss_path.read_text(encoding="utf-8")
+                conteudo = qss_path.read_text(encoding="utf-8")
             except Exception:
                 # Continue tentando outras pastas se a leitura falhar
-                pass
+                continue
+            _QSS_PATH_CACHE[filename] = qss_path
+            return conteudo
     return ""
 
 
-def apply_theme(app: QApplication, theme: str = "dark") -> None:
+def _minify_qss(qss: str) -> str:
+    """Remove comentários e linhas em branco para baratear o parse do Qt."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\n\s*\n+", "\n", qss)
+    return qss.strip()
+
+
+@lru_cache(maxsize=4)
+def _qss_for_theme(theme: str) -> str:
+    """
+    Resolve (uma única vez por tema) o QSS final já minificado. Alternar
+    o tema repetidas vezes não relê arquivo nem refaz a minificação — o
+    custo restante do toggle é só o polish interno do Qt.
+    """
     if theme == "light":
-        qss = _load_qss("light.qss")
-        if not qss:
-            qss = LIGHT_FALLBACK
+        qss = _load_qss("light.qss") or _fallback_qss("light")
     else:
-        qss = _load_qss("dark.qss")
-        if not qss:
-            qss = DARK_FALLBACK
-    app.setStyleSheet(qss)
+        qss = _load_qss("dark.qss") or _fallback_qss("dark")
+    return _minify_qss(qss)
+
+
+def reload_theme_cache() -> None:
+    """Limpa os caches de QSS (útil em desenvolvimento ao editar os temas)."""
+    _qss_for_theme.cache_clear()
+    _QSS_PATH_CACHE.clear()
+
+
+def apply_theme(app: QApplication, theme: str = "dark") -> None:
+    app.setStyleSheet(_qss_for_theme(theme))
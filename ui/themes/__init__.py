@@ -0,0 +1 @@
+"""QSS de fallback dos temas, lidos via ``importlib.resources``."""
@@ -16,6 +16,7 @@ and does not directly interact with the database.
 
 from __future__ import annotations
 
+import time
 from typing import Optional
 
 from PyQt5 import QtWidgets, QtCore, QtGui
@@ -27,6 +28,26 @@ except ImportError:
     # Caso contrário, importa diretamente o módulo models do projeto
     import models  # type: ignore
 
+try:
+    from . import _refdata_cache
+except ImportError:
+    import _refdata_cache  # type: ignore
+
+# Liga as funções quentes da camada de modelos a nomes do módulo: evita o
+# lookup de atributo a cada chamada e documenta a superfície de API usada
+_listar_tx = models.listar_transacoes_filtradas
+_criar_tx = models.criar_transacao
+_editar_tx = models.editar_transacao
+_excluir_tx = models.excluir_transacao
+
+
+def _fmt_iso_to_br(s: Optional[str]) -> Optional[str]:
+    """Converte ``yyyy-MM-dd`` em ``dd/MM/yyyy`` por fatiamento de string —
+    bem mais barato que construir um QDate por linha."""
+    if s and len(s) >= 10:
+        return f"{s[8:10]}/{s[5:7]}/{s[:4]}"
+    return s
+
 
 class TransacaoDialog(QtWidgets.QDialog):
     """Dialog to edit a single transaction.
@@ -64,20 +85,18 @@ class TransacaoDialog(QtWidgets.QDialog):
         # Categoria
         self.combo_categoria = QtWidgets.QComboBox()
         self.combo_categoria.setEditable(False)
-        # Populate categories
-        categorias = models.listar_categorias(self.codigoempresa)
+        # Populate categories (listas memoizadas por empresa)
         self.combo_categoria.addItem("-- Nenhuma --", None)
-        for cat in categorias:
-            self.combo_categoria.addItem(cat["nome"], cat["id"])
+        for cat_id, nome in _refdata_cache.categorias(self.codigoempresa):
+            self.combo_categoria.addItem(nome, cat_id)
         layout.addRow("Categoria:", self.combo_categoria)
 
         # Centro de custo
         self.combo_centro = QtWidgets.QComboBox()
         self.combo_centro.setEditable(False)
-        centros = models.listar_centros_custo(self.codigoempresa)
         self.combo_centro.addItem("-- Nenhum --", None)
-        for cc in centros:
-            self.combo_centro.addItem(cc["nome"], cc["id"])
+        for cc_id, nome in _refdata_cache.centros_custo(self.codigoempresa):
+            self.combo_centro.addItem(nome, cc_id)
         layout.addRow("Centro de Custo:", self.combo_centro)
 
         # Valor
@@ -130,7 +149,7 @@ class TransacaoDialog(QtWidgets.QDialog):
         try:
             if self.transacao:
                 # Update existing transaction
-                models.editar_transacao(
+                _editar_tx(
                     self.transacao["id"],
                     descricao if descricao else None,
                     categoria_id,
@@ -141,15 +160,15 @@ class TransacaoDialog(QtWidgets.QDialog):
                 )
             else:
                 # Create a new transaction. We'll need a conta; ask the user to select one.
-                contas = models.listar_contas(self.codigoempresa)
+                contas = _refdata_cache.contas(self.codigoempresa)
                 if not contas:
                     QtWidgets.QMessageBox.warning(self, "Nenhuma conta", "Crie uma conta antes de adicionar transações.")
                     return
                 # If only one account, use it; otherwise prompt user to select one
                 if len(contas) == 1:
-                    conta_id = contas[0]["id"]
+                    conta_id = contas[0][0]
                 else:
-                    names = [c.get("nome_conta") or str(c.get("id")) for c in contas]
+                    names = [nome for _cid, nome in contas]
                     item, ok = QtWidgets.QInputDialog.getItem(
                         self,
                         "Selecionar Conta",
@@ -160,11 +179,10 @@ class TransacaoDialog(QtWidgets.QDialog):
                     )
                     if not ok:
                         return
-                    idx = names.index(item)
-                    conta_id = contas[idx]["id"]
+                    conta_id = contas[names.index(item)][0]
                 # Data de lançamento: hoje
                 data_lanc = QtCore.QDate.currentDate().toString("yyyy-MM-dd")
-                models.criar_transacao(
+                _criar_tx(
                     self.codigoempresa,
                     conta_id,
                     data_lanc,
@@ -181,14 +199,282 @@ class TransacaoDialog(QtWidgets.QDialog):
         self.accept()
 
 
+class _TxLoaderSignals(QtCore.QObject):
+    # geração, página e linhas — a geração permite descartar respostas de
+    # consultas já superadas por um filtro mais novo
+    loaded = QtCore.pyqtSignal(int, int, list)
+    failed = QtCore.pyqtSignal(int, str)
+
+
+class _TransacoesLoader(QtCore.QRunnable):
+    """
+    Executa ``listar_transacoes_filtradas`` fora da thread de UI. Cada
+    chamada da camada de modelos abre sua própria conexão SQLite, então a
+    consulta é segura em outra thread; o resultado volta por sinal na
+    thread da UI.
+    """
+
+    def __init__(
+        self,
+        gen: int,
+        page: int,
+        codigoempresa: str,
+        busca: Optional[str],
+        data_inicio: Optional[str],
+        data_fim: Optional[str],
+        limite: int,
+    ) -> None:
+        super().__init__()
+        self.gen = gen
+        self.page = page
+        self.codigoempresa = codigoempresa
+        self.busca = busca
+        self.data_inicio = data_inicio
+        self.data_fim = data_fim
+        self.limite = limite
+        self.signals = _TxLoaderSignals()
+
+    def run(self) -> None:
+        try:
+            rows = _listar_tx(
+                self.codigoempresa,
+                busca=self.busca,
+                data_inicio=self.data_inicio,
+                data_fim=self.data_fim,
+                limite=self.limite,
+                offset=self.page * self.limite,
+            )
+        except Exception as exc:
+            # O QMessageBox precisa da thread da UI, então o erro volta
+            # por sinal em vez de ser tratado aqui
+            self.signals.failed.emit(self.gen, str(exc))
+            return
+        self.signals.loaded.emit(self.gen, self.page, rows)
+
+
+class TransacoesModel(QtCore.QAbstractListModel):
+    """
+    Modelo de lista sobre os dicts de ``listar_transacoes_filtradas``. O
+    delegate pinta cada cartão a partir do dict exposto em ``Qt.UserRole``;
+    não há árvore de widgets por registro.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: list[dict] = []
+
+    def set_rows(self, rows: list[dict]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def append_rows(self, rows: list[dict]) -> None:
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if index.isValid() and role == QtCore.Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def row_dict(self, row: int) -> Optional[dict]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+
+class TransacaoCardDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Pinta um cartão de transação (barra colorida, descrição, valor, linha
+    de info e ações) direto com QPainter. Só as linhas visíveis no
+    viewport pagam custo de renderização, independente do tamanho da lista.
+    """
+
+    edit_requested = QtCore.pyqtSignal(int)
+    delete_requested = QtCore.pyqtSignal(int)
+
+    CARD_HEIGHT = 96
+    BAR_WIDTH = 6
+    BTN_WIDTH = 60
+    BTN_HEIGHT = 22
+    MARGIN_V = 4
+
+    # QColors construídos uma vez na definição da classe — o paint() só
+    # faz lookup, sem parsear hex por linha visível a cada repaint
+    _PALETTES = {
+        "dark": {
+            "card": QtGui.QColor("#0f172a"),
+            "header": QtGui.QColor("#e5e7eb"),
+            "info": QtGui.QColor("#9ca3af"),
+        },
+        "light": {
+            "card": QtGui.QColor("#ffffff"),
+            "header": QtGui.QColor("#111827"),
+            "info": QtGui.QColor("#6b7280"),
+        },
+    }
+    _COLOR_POS = QtGui.QColor("#22c55e")
+    _COLOR_NEG = QtGui.QColor("#ef4444")
+    _COLOR_NEUTRO = QtGui.QColor("#6b7280")
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None, theme: str = "dark") -> None:
+        super().__init__(parent)
+        self.theme = theme
+
+    def sizeHint(self, option, index) -> QtCore.QSize:
+        return QtCore.QSize(200, self.CARD_HEIGHT)
+
+    def _card_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        return rect.adjusted(0, self.MARGIN_V, 0, -self.MARGIN_V)
+
+    def _btn_rects(self, card_rect: QtCore.QRect) -> tuple:
+        y = card_rect.bottom() - self.BTN_HEIGHT - 6
+        edit = QtCore.QRect(
+            card_rect.left() + self.BAR_WIDTH + 12, y, self.BTN_WIDTH, self.BTN_HEIGHT
+        )
+        delete = QtCore.QRect(edit.right() + 8, y, self.BTN_WIDTH, self.BTN_HEIGHT)
+        return edit, delete
+
+    @classmethod
+    def _valor_color(cls, val, fallback: QtGui.QColor) -> QtGui.QColor:
+        if val is None or val == 0:
+            return fallback
+        return cls._COLOR_POS if val > 0 else cls._COLOR_NEG
+
+    @classmethod
+    def _bar_pixmap(cls, color: QtGui.QColor, height: int) -> QtGui.QPixmap:
+        key = f"txbar-{color.name()}-{height}"
+        pm = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, pm):
+            pm = QtGui.QPixmap(cls.BAR_WIDTH, height)
+            pm.fill(QtCore.Qt.transparent)
+            p = QtGui.QPainter(pm)
+            p.setRenderHint(QtGui.QPainter.Antialiasing)
+            p.setPen(QtCore.Qt.NoPen)
+            p.setBrush(color)
+            p.drawRoundedRect(0, 0, cls.BAR_WIDTH, height, 3, 3)
+            p.end()
+            QtGui.QPixmapCache.insert(key, pm)
+        return pm
+
+    def paint(self, painter: QtGui.QPainter, option, index) -> None:
+        t = index.data(QtCore.Qt.UserRole)
+        if not t:
+            return
+        pal = self._PALETTES.get(self.theme, self._PALETTES["dark"])
+        card_rect = self._card_rect(option.rect)
+        val = t.get("valor")
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+
+        # Fundo do cartão
+        painter.setBrush(pal["card"])
+        painter.drawRoundedRect(card_rect, 8, 8)
+
+        # Barra colorida à esquerda (verde/vermelho/cinza conforme o valor).
+        # O retângulo arredondado é rasterizado uma vez por (cor, altura) no
+        # QPixmapCache; os paints seguintes só blitam o pixmap pronto.
+        bar_color = self._valor_color(val, self._COLOR_NEUTRO)
+        painter.drawPixmap(
+            card_rect.topLeft(), self._bar_pixmap(bar_color, card_rect.height())
+        )
+
+        content_left = card_rect.left() + self.BAR_WIDTH + 12
+        content_width = card_rect.right() - 12 - content_left
+
+        # Cabeçalho: descrição à esquerda, valor à direita
+        font = painter.font()
+        font.setBold(True)
+        painter.setFont(font)
+        header_rect = QtCore.QRect(content_left, card_rect.top() + 6, content_width, 20)
+        painter.setPen(pal["header"])
+        painter.drawText(
+            header_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            t.get("descricao_tratada") or t.get("descricao_extrato") or "",
+        )
+        painter.setPen(self._valor_color(val, pal["header"]))
+        painter.drawText(
+            header_rect,
+            QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter,
+            t.get("_valor_fmt") or "",
+        )
+
+        # Linha de informações (pré-computada no carregamento)
+        font.setBold(False)
+        painter.setFont(font)
+        info_rect = QtCore.QRect(content_left, header_rect.bottom() + 2, content_width, 16)
+        painter.setPen(pal["info"])
+        painter.drawText(
+            info_rect,
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+            t.get("_info") or "",
+        )
+
+        # Ações Editar/Excluir como "botões" pintados
+        edit_rect, delete_rect = self._btn_rects(card_rect)
+        painter.setPen(pal["info"])
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRoundedRect(edit_rect, 6, 6)
+        painter.drawRoundedRect(delete_rect, 6, 6)
+        painter.setPen(pal["header"])
+        painter.drawText(edit_rect, QtCore.Qt.AlignCenter, "Editar")
+        painter.drawText(delete_rect, QtCore.Qt.AlignCenter, "Excluir")
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            event.type() == QtCore.QEvent.MouseButtonRelease
+            and event.button() == QtCore.Qt.LeftButton
+        ):
+            edit_rect, delete_rect = self._btn_rects(self._card_rect(option.rect))
+            if edit_rect.contains(event.pos()):
+                self.edit_requested.emit(index.row())
+                return True
+            if delete_rect.contains(event.pos()):
+                self.delete_requested.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class TransactionsView(QtWidgets.QWidget):
     """Widget to display and manage financial transactions."""
 
+    # Quantidade de transações buscadas por página; as próximas páginas
+    # chegam conforme o usuário rola a lista
+    PAGE_SIZE = 50
+
+    # Validade (segundos) do resultado da última consulta: recargas com o
+    # mesmo filtro dentro desse intervalo reutilizam o que já está na tela
+    CACHE_TTL = 30.0
+
     def __init__(self, codigoempresa: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.codigoempresa = codigoempresa
         # Keep track of current theme to adjust styles on the fly
         self.current_theme: str = "dark"
+        # Estado da paginação
+        self._page = 0
+        self._exhausted = False
+        self._total_receitas = 0.0
+        self._total_despesas = 0.0
+        # Geração das consultas em segundo plano: respostas de uma geração
+        # antiga (filtro já trocado) são descartadas
+        self._fetch_gen = 0
+        self._fetching = False
+        # Memo do último filtro consultado (invalidado em criar/editar/
+        # excluir); evita bater no banco em recargas repetidas
+        self._last_filter: Optional[tuple] = None
+        self._last_ts = 0.0
         self._build_ui()
         self._load_data()
 
@@ -204,8 +490,12 @@ class TransactionsView(QtWidgets.QWidget):
                     "#e5e7eb" if theme == "dark" else "#111827"
                 )
             )
-        # Reload data to rebuild cards with appropriate styles
-        self._load_data()
+        # Trocar o tema não consulta o banco nem recarrega a lista: basta
+        # trocar a paleta do delegate e repintar o viewport
+        if hasattr(self, "card_delegate"):
+            self.card_delegate.theme = theme
+        if hasattr(self, "list_view"):
+            self.list_view.viewport().update()
 
         # Atualiza a cor do resumo
         if hasattr(self, "lbl_summary"):
@@ -245,15 +535,21 @@ class TransactionsView(QtWidgets.QWidget):
         filter_layout.addWidget(self.btn_filter)
         layout.addLayout(filter_layout)
 
-        # Área de cartões em um scroll
-        self.scroll_area = QtWidgets.QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.cards_container = QtWidgets.QWidget()
-        self.cards_layout = QtWidgets.QVBoxLayout(self.cards_container)
-        self.cards_layout.setContentsMargins(0, 0, 0, 0)
-        self.cards_layout.setSpacing(8)
-        self.scroll_area.setWidget(self.cards_container)
-        layout.addWidget(self.scroll_area)
+        # Lista de cartões renderizada por delegate: nada de uma árvore de
+        # QFrames/QLabels por registro — só as linhas visíveis são pintadas
+        self.list_view = QtWidgets.QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.list_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.model = TransacoesModel(self)
+        self.list_view.setModel(self.model)
+        self.card_delegate = TransacaoCardDelegate(self.list_view, theme=self.current_theme)
+        self.list_view.setItemDelegate(self.card_delegate)
+        self.card_delegate.edit_requested.connect(self._edit_row)
+        self.card_delegate.delete_requested.connect(self._delete_row)
+        # Rolar até perto do fim busca a próxima página
+        self.list_view.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        layout.addWidget(self.list_view)
 
         # Área de botões
         btn_layout = QtWidgets.QHBoxLayout()
@@ -276,20 +572,39 @@ class TransactionsView(QtWidgets.QWidget):
         self.lbl_summary.setStyleSheet("font-size: 12px; color: #9ca3af;")
         layout.addWidget(self.lbl_summary)
 
+        # Debounce dos filtros: digitação rápida e ajustes de data são
+        # coalescidos em uma única consulta após uma pausa de 250ms
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(250)
+        self._filter_timer.timeout.connect(self._load_data)
+        self.search_edit.textChanged.connect(self._schedule_filter)
+        self.start_date_edit.dateChanged.connect(self._schedule_filter)
+        self.end_date_edit.dateChanged.connect(self._schedule_filter)
+
         # Conexões
-        self.btn_filter.clicked.connect(self._load_data)
-        self.btn_refresh.clicked.connect(self._load_data)
+        # Cliques explícitos sempre reconsultam; o memo de filtro vale só
+        # para as recargas disparadas pelo debounce
+        self.btn_filter.clicked.connect(self._force_refresh)
+        self.btn_refresh.clicked.connect(self._force_refresh)
         # Para cartões, edição/exclusão serão tratadas individualmente em cada card
         self.btn_edit.clicked.connect(self._edit_selected)
         self.btn_delete.clicked.connect(self._delete_selected)
         self.btn_add.clicked.connect(self._add_transaction)
 
-    def _load_data(self) -> None:
-        """
-        Load transactions into the table, applying optional filters from
-        the search text and date fields. Also updates the summary label.
-        """
-        # Build filter parameters
+    @QtCore.pyqtSlot()
+    def _schedule_filter(self) -> None:
+        """(Re)arma o timer de debounce dos filtros."""
+        self._filter_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _force_refresh(self) -> None:
+        """Recarrega ignorando o memo — dados podem ter mudado fora da tela."""
+        self._last_filter = None
+        self._load_data()
+
+    def _current_filters(self) -> tuple:
+        """Lê (busca, data_inicio, data_fim) dos campos de filtro."""
         busca = self.search_edit.text().strip() or None
         data_inicio = None
         # Only use start date if the QDate is valid and not null
@@ -300,161 +615,158 @@ class TransactionsView(QtWidgets.QWidget):
         qd_end = self.end_date_edit.date()
         if qd_end.isValid() and not qd_end.isNull():
             data_fim = qd_end.toString("yyyy-MM-dd")
-
-        try:
-            transacoes = models.listar_transacoes_filtradas(
-                self.codigoempresa,
-                busca=busca,
-                data_inicio=data_inicio,
-                data_fim=data_fim,
-                limite=500,
-            )
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(
-                self,
-                "Erro",
-                f"Falha ao carregar transações:\n{exc}",
-            )
-            return
-
-        # Atualiza resumo de receitas e despesas
-        total_receitas = sum(t.get("valor", 0) for t in transacoes if t.get("valor", 0) > 0)
-        total_despesas = sum(-t.get("valor", 0) for t in transacoes if t.get("valor", 0) < 0)
+        return busca, data_inicio, data_fim
+
+    def _start_fetch(self, page: int) -> None:
+        """Dispara a busca de uma página no pool global de threads."""
+        busca, data_inicio, data_fim = self._current_filters()
+        loader = _TransacoesLoader(
+            self._fetch_gen,
+            page,
+            self.codigoempresa,
+            busca,
+            data_inicio,
+            data_fim,
+            self.PAGE_SIZE,
+        )
+        loader.signals.loaded.connect(self._apply_page)
+        loader.signals.failed.connect(self._fetch_failed)
+        self._loader = loader  # mantém viva a QObject dos sinais
+        self._fetching = True
+        QtCore.QThreadPool.globalInstance().start(loader)
+
+    def _process_rows(self, transacoes: list) -> None:
+        """Acumula os totais e monta a linha de info de cada cartão
+        (o delegate só lê a string pronta)."""
+        for t in transacoes:
+            v = t.get("valor")
+            # Valor formatado uma vez por carga; o delegate só lê a string
+            # pronta a cada repaint
+            t["_valor_fmt"] = f"{v:.2f}" if v is not None else ""
+            v = v or 0
+            if v > 0:
+                self._total_receitas += v
+            elif v < 0:
+                self._total_despesas -= v
+            t["_info"] = self._build_info_line(t)
         self.lbl_summary.setText(
-            f"Receitas: {total_receitas:.2f} | Despesas: {total_despesas:.2f}"
+            f"Receitas: {self._total_receitas:.2f} | "
+            f"Despesas: {self._total_despesas:.2f}"
         )
 
-        # Remove cartões existentes
-        while self.cards_layout.count():
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+    def _load_data(self) -> None:
+        """
+        Load the first page of transactions, applying optional filters
+        from the search text and date fields. Also updates the summary
+        label (totals reflect the pages loaded so far).
+        """
+        # Mesmo filtro, resultado recente e nenhuma mutação no meio: o que
+        # está na tela continua válido, não há por que reconsultar
+        key = self._current_filters()
+        if (
+            key == self._last_filter
+            and time.monotonic() - self._last_ts < self.CACHE_TTL
+        ):
+            return
+        # A consulta roda fora da thread de UI; a resposta chega em
+        # _apply_page. Incrementar a geração invalida buscas em voo.
+        self._fetch_gen += 1
+        self._last_filter = key
+        self._page = 0
+        self._exhausted = False
+        self._total_receitas = 0.0
+        self._total_despesas = 0.0
+        self.lbl_summary.setText("Carregando...")
+        self._start_fetch(0)
+
+    @QtCore.pyqtSlot(int, str)
+    def _fetch_failed(self, gen: int, msg: str) -> None:
+        if gen != self._fetch_gen:
+            # Resposta de um filtro já superado
+            return
+        self._fetching = False
+        # Sem resultado válido para memorizar: a próxima recarga reconsulta
+        self._last_filter = None
+        self.lbl_summary.setText("Receitas: 0.00 | Despesas: 0.00")
+        QtWidgets.QMessageBox.critical(
+            self, "Erro", f"Falha ao carregar transações:\n{msg}"
+        )
 
-        for t in transacoes:
-            # Determine base colors based on theme
-            if self.current_theme == "light":
-                card_bg = "#ffffff"
-                header_color = "#111827"
-                info_color = "#6b7280"
-            else:
-                card_bg = "#0f172a"
-                header_color = "#e5e7eb"
-                info_color = "#9ca3af"
-            # Create a card with coloured side bar
-            outer_frame = QtWidgets.QFrame()
-            outer_layout = QtWidgets.QHBoxLayout(outer_frame)
-            outer_layout.setContentsMargins(0, 0, 0, 0)
-            outer_layout.setSpacing(0)
-            # Color bar
-            valor = t.get("valor")
-            bar = QtWidgets.QFrame()
-            bar.setFixedWidth(6)
-            if valor is not None:
-                if valor > 0:
-                    bar_color = "#22c55e"
-                elif valor < 0:
-                    bar_color = "#ef4444"
-                else:
-                    bar_color = "#6b7280"
-            else:
-                bar_color = "#6b7280"
-            bar.setStyleSheet(
-                f"background-color: {bar_color}; border-top-left-radius: 8px; border-bottom-left-radius: 8px;"
-            )
-            outer_layout.addWidget(bar)
-            # Card content
-            card = QtWidgets.QFrame()
-            card.setStyleSheet(
-                f"background-color: {card_bg}; border-radius: 8px; padding: 8px;"
-            )
-            card_layout = QtWidgets.QVBoxLayout(card)
-            card_layout.setContentsMargins(12, 8, 12, 8)
-            card_layout.setSpacing(4)
-            # Linha principal: descrição e valor
-            header_layout = QtWidgets.QHBoxLayout()
-            lbl_desc = QtWidgets.QLabel(t.get("descricao_tratada") or t.get("descricao_extrato") or "")
-            lbl_desc.setStyleSheet(
-                f"font-size: 14px; font-weight: bold; color: {header_color};"
-            )
-            header_layout.addWidget(lbl_desc)
-            header_layout.addStretch()
-            lbl_valor = QtWidgets.QLabel(
-                f"{valor:.2f}" if valor is not None else ""
-            )
-            # Color value text
-            if valor is not None:
-                if valor > 0:
-                    val_color = "#22c55e"
-                elif valor < 0:
-                    val_color = "#ef4444"
-                else:
-                    val_color = header_color
-            else:
-                val_color = header_color
-            lbl_valor.setStyleSheet(
-                f"color: {val_color}; font-size: 14px; font-weight: bold;"
-            )
-            header_layout.addWidget(lbl_valor)
-            card_layout.addLayout(header_layout)
-            # Linha secundária: Data, Conta, Categoria, Centro
-            info_parts = []
-            data = t.get("data_lancamento") or ""
-            if data:
-                info_parts.append(f"{data}")
-            conta = t.get("nome_conta") or ""
-            if conta:
-                info_parts.append(f"Conta: {conta}")
-            categoria = t.get("categoria_nome") or ""
-            if categoria:
-                info_parts.append(f"Categoria: {categoria}")
-            centro = t.get("centro_nome") or ""
-            if centro:
-                info_parts.append(f"Centro: {centro}")
-            forma = t.get("forma_pagamento") or ""
-            if forma:
-                info_parts.append(f"Forma: {forma}")
-            tipo_str = "Crédito" if (valor is not None and valor > 0) else "Débito"
-            info_parts.append(tipo_str)
-            lbl_info = QtWidgets.QLabel("  |  ".join(info_parts))
-            lbl_info.setStyleSheet(
-                f"font-size: 11px; color: {info_color};"
-            )
-            card_layout.addWidget(lbl_info)
-            # Botões de ação
-            btn_layout = QtWidgets.QHBoxLayout()
-            btn_edit = QtWidgets.QPushButton("Editar")
-            btn_edit.setFixedWidth(60)
-            btn_delete = QtWidgets.QPushButton("Excluir")
-            btn_delete.setFixedWidth(60)
-            btn_layout.addWidget(btn_edit)
-            btn_layout.addWidget(btn_delete)
-            btn_layout.addStretch()
-            card_layout.addLayout(btn_layout)
-            # Armazena a transação no botão
-            btn_edit.clicked.connect(lambda _=False, d=t: self._edit_card(d))
-            btn_delete.clicked.connect(lambda _=False, d=t: self._delete_card(d))
-            # Add card content to outer layout
-            outer_layout.addWidget(card)
-            # Add outer frame to container
-            self.cards_layout.addWidget(outer_frame)
-        # Adiciona um espaçador para empurrar cartões para cima
-        self.cards_layout.addStretch()
+    @QtCore.pyqtSlot(int, int, list)
+    def _apply_page(self, gen: int, page: int, rows: list) -> None:
+        if gen != self._fetch_gen:
+            # Resposta de um filtro já superado
+            return
+        self._fetching = False
+        self._page = page
+        self._exhausted = len(rows) < self.PAGE_SIZE
+        self._last_ts = time.monotonic()
+        self._process_rows(rows)
+        if page == 0:
+            # Suspende a pintura durante o reset do modelo: uma única
+            # relayout/repaint ao final, em vez de uma por sinal
+            # intermediário
+            self.list_view.setUpdatesEnabled(False)
+            try:
+                self.model.set_rows(rows)
+            finally:
+                self.list_view.setUpdatesEnabled(True)
+        else:
+            self.model.append_rows(rows)
+
+    @QtCore.pyqtSlot(int)
+    def _on_scroll(self, value: int) -> None:
+        if value >= self.list_view.verticalScrollBar().maximum() - 200:
+            self._load_next_page()
+
+    def _load_next_page(self) -> None:
+        if self._exhausted or self._fetching:
+            return
+        self._start_fetch(self._page + 1)
+
+    @staticmethod
+    def _build_info_line(t: dict) -> str:
+        """Monta a linha de informações exibida no cartão."""
+        g = t.get
+        pairs = (
+            ("", _fmt_iso_to_br(g("data_lancamento"))),
+            ("Conta: ", g("nome_conta")),
+            ("Categoria: ", g("categoria_nome")),
+            ("Centro: ", g("centro_nome")),
+            ("Forma: ", g("forma_pagamento")),
+        )
+        info_parts = [f"{prefixo}{valor}" for prefixo, valor in pairs if valor]
+        info_parts.append("Crédito" if (g("valor") or 0) > 0 else "Débito")
+        return "  |  ".join(info_parts)
 
     def _add_transaction(self) -> None:
         """Open a dialog to create a new transaction."""
         # Create an empty dialog (transacao=None)
         dlg = TransacaoDialog(self.codigoempresa, None, self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            self._last_filter = None
             self._load_data()
 
     # ------------------------------------------------------------------
     # Card-based actions
     # ------------------------------------------------------------------
+    @QtCore.pyqtSlot(int)
+    def _edit_row(self, row: int) -> None:
+        t = self.model.row_dict(row)
+        if t is not None:
+            self._edit_card(t)
+
+    @QtCore.pyqtSlot(int)
+    def _delete_row(self, row: int) -> None:
+        t = self.model.row_dict(row)
+        if t is not None:
+            self._delete_card(t)
+
     def _edit_card(self, transacao: dict) -> None:
         """Edit a specific transaction represented by a card."""
         dlg = TransacaoDialog(self.codigoempresa, transacao, self)
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            self._last_filter = None
             self._load_data()
 
     def _delete_card(self, transacao: dict) -> None:
@@ -468,10 +780,11 @@ class TransactionsView(QtWidgets.QWidget):
         if confirm != QtWidgets.QMessageBox.Yes:
             return
         try:
-            models.excluir_transacao(transacao["id"])
+            _excluir_tx(transacao["id"])
         except Exception as exc:
             QtWidgets.QMessageBox.critical(self, "Erro", f"Erro ao excluir transação:\n{exc}")
             return
+        self._last_filter = None
         self._load_data()
 
     def _edit_selected(self) -> None: